@@ -3,6 +3,7 @@ import logging
 import pathlib
 import textwrap
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from ..lib import PolygenicScore
@@ -10,6 +11,9 @@ from pgscatalog.core import chrom_keyfunc
 
 logger = logging.getLogger(__name__)
 
+# how many score files to read ahead of aggregation
+_N_READERS = 4
+
 
 def run_aggregate():
     logging.basicConfig(
@@ -35,17 +39,29 @@ def run_aggregate():
     observed_columns = set()
     aggregated: Optional[PolygenicScore] = None
 
-    # first, use PolygenicScore's __add__ method, which implements df.add(fill_value=0)
-    while pgs:
-        # popleft ensures that dfs are removed from memory after each aggregation
-        score: PolygenicScore = pgs.popleft()
-        if aggregated is None:
-            logger.info(f"Initialising aggregation with {score}")
-            aggregated: PolygenicScore = score
-        else:
-            logger.info(f"Adding {score}")
-            aggregated += score
-        observed_columns.update(set(score.df.columns))
+    # reading scores is mostly decompression and parsing, which release the GIL
+    # so read a few scores ahead in threads while aggregating in the main thread
+    # the number of pending reads is bounded to keep a handful of dfs in memory
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=_N_READERS) as executor:
+        # first, use PolygenicScore's __add__ method, which implements df.add(fill_value=0)
+        while pgs or pending:
+            while pgs and len(pending) < _N_READERS:
+                # popleft ensures that dfs are removed from memory after each aggregation
+                score: PolygenicScore = pgs.popleft()
+                pending.append((score, executor.submit(lambda x: x.df, score)))
+
+            score, future = pending.popleft()
+            # important to grab result to raise exceptions
+            future.result()
+            if aggregated is None:
+                logger.info(f"Initialising aggregation with {score}")
+                aggregated: PolygenicScore = score
+            else:
+                logger.info(f"Adding {score}")
+                aggregated += score
+            observed_columns.update(set(score.df.columns))
 
     # check to make sure that every column we saw in the dataframes is in the output
     if (dfcols := set(aggregated.df.columns)) != observed_columns:
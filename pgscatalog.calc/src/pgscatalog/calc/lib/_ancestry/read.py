@@ -13,29 +13,28 @@ def read_pcs(loc_pcs: list[str], dataset: str, loc_related_ids=None, nPCs=None):
     :param loc_related_ids: path to newline-delimited list of IDs for related samples that can be used to filter
     :return: pandas dataframe with PC information
     """
-    proj = pd.DataFrame()
+    if nPCs:
+        # skip unused PCs while parsing instead of copying the combined DF to drop them
+        logger.debug("Filtering to relevant PCs")
+
+        def usecols(x):
+            return x == "IID" or int(x[2:]) <= nPCs
+
+    else:
+        usecols = None
 
-    for i, path in enumerate(loc_pcs):
+    dfs = []
+    for path in loc_pcs:
         logger.debug("Reading PCA projection: {}".format(path))
-        df = pd.read_csv(path, sep="\t", converters={"IID": str}, header=0)
+        df = pd.read_csv(
+            path, sep="\t", converters={"IID": str}, header=0, usecols=usecols
+        )
         df["sampleset"] = dataset
-        df.set_index(["sampleset", "IID"], inplace=True)
-
-        if i == 0:
-            logger.debug("Initialising combined DF")
-            proj = df.copy()
-        else:
-            logger.debug("Appending to combined DF")
-            proj = pd.concat([proj, df])
+        dfs.append(df.set_index(["sampleset", "IID"]))
 
-    # Drop PCs
-    if nPCs:
-        logger.debug("Filtering to relevant PCs")
-        dropcols = []
-        for x in proj.columns:
-            if int(x[2:]) > nPCs:
-                dropcols.append(x)
-        proj = proj.drop(dropcols, axis=1)
+    # concatenate once instead of copying the combined DF each time a file is read
+    logger.debug("Combining {} PCA projection(s)".format(len(dfs)))
+    proj = pd.concat(dfs)
 
     # Read/process IDs for unrelated samples (usually reference dataset)
     if loc_related_ids:
@@ -81,11 +80,15 @@ def read_pgs(loc_aggscore):
     :return:
     """
     logger.debug("Reading aggregated score data: {}".format(loc_aggscore))
+    # only SUM is pivoted, and the same few accessions repeat for every sample, so
+    # store PGS as a category instead of one python string per row
     df = pd.read_csv(
         loc_aggscore,
         sep="\t",
         index_col=["sampleset", "IID"],
+        usecols=["sampleset", "IID", "PGS", "SUM"],
         converters={"IID": str},
+        dtype={"PGS": "category"},
         header=0,
     ).pivot(columns=["PGS"], values=["SUM"])
     # rename to PGS only
@@ -145,10 +145,15 @@ def compare_ancestry(
         logger.debug("Calculating Mahalanobis distances")
         # Calculate population distances
         pval_cols = []
+        # p-values are collected per population and each dataframe is built once,
+        # instead of inserting distance and p-value columns into ref_df / target_df
+        ref_pvals = {}
+        target_pvals = {}
+        ref_pcs = ref_df[cols_pcs]
+        target_pcs = target_df[cols_pcs]
         for pop in ref_populations:
             logger.debug("Fitting Mahalanobis distances: {}".format(pop))
             # Fit the covariance matrix for the current population
-            colname_dist = "Mahalanobis_dist_{}".format(pop)
             colname_pval = "Mahalanobis_P_{}".format(pop)
 
             covariance_model = get_covariance_method(covariance_method)
@@ -159,23 +164,30 @@ def compare_ancestry(
 
             # Caclulate Mahalanobis distance of each sample to that population
             # Reference Samples
-            ref_df[colname_dist] = covariance_fit.mahalanobis(ref_df[cols_pcs])
-            ref_df[colname_pval] = chi2.sf(ref_df[colname_dist], n_pcs - 1)
+            ref_pvals[colname_pval] = chi2.sf(
+                covariance_fit.mahalanobis(ref_pcs), n_pcs - 1
+            )
             # Target Samples
-            target_df[colname_dist] = covariance_fit.mahalanobis(target_df[cols_pcs])
-            target_df[colname_pval] = chi2.sf(target_df[colname_dist], n_pcs - 1)
+            target_pvals[colname_pval] = chi2.sf(
+                covariance_fit.mahalanobis(target_pcs), n_pcs - 1
+            )
 
             pval_cols.append(colname_pval)
 
         # Assign population (maximum probability)
         logger.debug("Assigning Populations (max Mahalanobis probability)")
-        ref_assign = ref_df[pval_cols].copy()
-        ref_assign = ref_assign.assign(MostSimilarPop=ref_assign.idxmax(axis=1))
+        # index population labels by the position of the max p-value column, instead
+        # of finding column names and splitting the labels out of them for every sample
+        pval_pops = np.array([x.split("_")[-1] for x in pval_cols])
+        ref_assign = pd.DataFrame(ref_pvals, index=ref_df.index)
+        ref_assign["MostSimilarPop"] = pval_pops[
+            np.nanargmax(ref_assign[pval_cols].to_numpy(), axis=1)
+        ]
 
-        target_assign = target_df[pval_cols].copy()
-        target_assign = target_assign.assign(
-            MostSimilarPop=target_assign.idxmax(axis=1)
-        )
+        target_assign = pd.DataFrame(target_pvals, index=target_df.index)
+        target_assign["MostSimilarPop"] = pval_pops[
+            np.nanargmax(target_assign[pval_cols].to_numpy(), axis=1)
+        ]
 
         ref_assign["MostSimilarPop_LowConfidence"] = np.nan
         target_assign["MostSimilarPop_LowConfidence"] = np.nan
@@ -186,22 +198,13 @@ def compare_ancestry(
                     p_threshold
                 )
             )
-            ref_assign["MostSimilarPop_LowConfidence"] = [
-                (ref_assign[x][i] < p_threshold)
-                for i, x in enumerate(ref_assign["MostSimilarPop"])
-            ]
-            target_assign["MostSimilarPop_LowConfidence"] = [
-                (target_assign[x][i] < p_threshold)
-                for i, x in enumerate(target_assign["MostSimilarPop"])
-            ]
-
-        # Cleanup variable names
-        ref_assign["MostSimilarPop"] = [
-            x.split("_")[-1] for x in ref_assign["MostSimilarPop"]
-        ]
-        target_assign["MostSimilarPop"] = [
-            x.split("_")[-1] for x in target_assign["MostSimilarPop"]
-        ]
+            # the most similar population always has the largest p-value
+            ref_assign["MostSimilarPop_LowConfidence"] = (
+                ref_assign[pval_cols].max(axis=1) < p_threshold
+            )
+            target_assign["MostSimilarPop_LowConfidence"] = (
+                target_assign[pval_cols].max(axis=1) < p_threshold
+            )
 
     elif method == "RandomForest":
         # Assign SuperPop Using Random Forest (PCA loadings)
@@ -214,17 +217,18 @@ def compare_ancestry(
 
         # Predict most similar population using RF classifier
         logger.debug("Find most similar Populations (max RF probability)")
+        prob_cols = ["RF_P_{}".format(x) for x in clf_rf.classes_]
         ref_assign = pd.DataFrame(
             clf_rf.predict_proba(ref_df[cols_pcs]),
             index=ref_df.index,
-            columns=["RF_P_{}".format(x) for x in clf_rf.classes_],
+            columns=prob_cols,
         )
         ref_assign["MostSimilarPop"] = clf_rf.predict(ref_df[cols_pcs])
 
         target_assign = pd.DataFrame(
             clf_rf.predict_proba(target_df[cols_pcs]),
             index=target_df.index,
-            columns=["RF_P_{}".format(x) for x in clf_rf.classes_],
+            columns=prob_cols,
         )
         target_assign["MostSimilarPop"] = clf_rf.predict(target_df[cols_pcs])
 
@@ -238,14 +242,13 @@ def compare_ancestry(
                     p_threshold
                 )
             )
-            ref_assign["MostSimilarPop_LowConfidence"] = [
-                (ref_assign["RF_P_{}".format(x)].iloc[i] < p_threshold)
-                for i, x in enumerate(clf_rf.predict(ref_df[cols_pcs]))
-            ]
-            target_assign["MostSimilarPop_LowConfidence"] = [
-                (target_assign["RF_P_{}".format(x)].iloc[i] < p_threshold)
-                for i, x in enumerate(clf_rf.predict(target_df[cols_pcs]))
-            ]
+            # predict() picks the class with the largest probability
+            ref_assign["MostSimilarPop_LowConfidence"] = (
+                ref_assign[prob_cols].max(axis=1) < p_threshold
+            )
+            target_assign["MostSimilarPop_LowConfidence"] = (
+                target_assign[prob_cols].max(axis=1) < p_threshold
+            )
 
     return ref_assign, target_assign, compare_info
 
@@ -331,6 +334,8 @@ def pgs_adjust(
     results_target = {}
     results_models = {}  # used to store regression information
     scorecols_drop = set()
+    # Check that PGS have variance (e.g. not all 0) in a single pass over all scores
+    ref_var = ref_df[scorecols].var(ddof=0)
     for c_pgs in scorecols:
         # Makes melting easier later
         sum_col = "SUM|{}".format(c_pgs)
@@ -338,8 +343,7 @@ def pgs_adjust(
         results_target[sum_col] = target_df[c_pgs]
         results_models = {}
 
-        # Check that PGS has variance (e.g. not all 0)
-        if np.var(results_ref[sum_col]) == 0:
+        if ref_var[c_pgs] == 0:
             scorecols_drop.add(c_pgs)
             logger.warning(
                 "Skipping adjustment: {} has 0 variance in PGS SUM [REFERENCE]".format(c_pgs)
@@ -352,6 +356,16 @@ def pgs_adjust(
         )
         results_models["dist_empirical"] = {}
 
+        # population masks are the same for every score, so only build them once
+        pop_masks = {
+            pop: (
+                ref_df[ref_pop_col] == pop,
+                target_df[target_pop_col] == pop,
+                ref_train_df[ref_pop_col] == pop,
+            )
+            for pop in ref_populations
+        }
+
         for c_pgs in scorecols:
             # Initialize Output
             percentile_col = "percentile_MostSimilarPop|{}".format(c_pgs)
@@ -369,23 +383,20 @@ def pgs_adjust(
                 # Adjust for each population
                 for pop in ref_populations:
                     r_pop = {}
-                    i_ref_pop = ref_df[ref_pop_col] == pop
-                    i_target_pop = target_df[target_pop_col] == pop
+                    i_ref_pop, i_target_pop, i_ref_train_pop = pop_masks[pop]
+                    ref_pop_pgs = ref_df.loc[i_ref_pop, c_pgs]
+                    target_pop_pgs = target_df.loc[i_target_pop, c_pgs]
 
                     # Reference Score Distribution
-                    c_pgs_pop_dist = ref_train_df.loc[
-                        ref_train_df[ref_pop_col] == pop, c_pgs
-                    ]
+                    c_pgs_pop_dist = ref_train_df.loc[i_ref_train_pop, c_pgs]
 
                     # Calculate Percentile
                     results_ref[percentile_col].loc[i_ref_pop] = percentileofscore(
-                        c_pgs_pop_dist, ref_df.loc[i_ref_pop, c_pgs]
+                        c_pgs_pop_dist, ref_pop_pgs
                     )
                     results_target[percentile_col].loc[
                         i_target_pop
-                    ] = percentileofscore(
-                        c_pgs_pop_dist, target_df.loc[i_target_pop, c_pgs]
-                    )
+                    ] = percentileofscore(c_pgs_pop_dist, target_pop_pgs)
                     r_pop["percentiles"] = np.percentile(
                         c_pgs_pop_dist, range(0, 101, 1)
                     )
@@ -395,10 +406,10 @@ def pgs_adjust(
                     r_pop["std"] = c_pgs_pop_dist.std(ddof=0)
 
                     results_ref[z_col].loc[i_ref_pop] = (
-                        ref_df.loc[i_ref_pop, c_pgs] - r_pop["mean"]
+                        ref_pop_pgs - r_pop["mean"]
                     ) / r_pop["std"]
                     results_target[z_col].loc[i_target_pop] = (
-                        target_df.loc[i_target_pop, c_pgs] - r_pop["mean"]
+                        target_pop_pgs - r_pop["mean"]
                     ) / r_pop["std"]
 
                     r_model[pop] = r_pop
@@ -561,13 +572,13 @@ def nLL_mu_and_var(theta, df, c_score, l_predictors):
     i_split = int(1 + (len(theta) - 2) / 2)
     theta_mu = theta[0:i_split]
     theta_var = theta[i_split:]
-    x = df[c_score]
-    return sum(
-        np.log(np.sqrt(f_var(df[l_predictors], theta_var)))
-        + (1 / 2)
-        * (x - f_mu(df[l_predictors], theta_mu)) ** 2
-        / f_var(df[l_predictors], theta_var)
-    )
+    x = df[c_score].to_numpy()
+    predictors = df[l_predictors].to_numpy()
+
+    # predict the variance once and sum with numpy, not a python loop over samples
+    pred_var = f_var(predictors, theta_var)
+    resid = x - f_mu(predictors, theta_mu)
+    return np.sum(np.log(np.sqrt(pred_var)) + (1 / 2) * resid**2 / pred_var)
 
 
 def grdnt_mu_and_var(theta, df, c_score, l_predictors):
@@ -577,25 +588,22 @@ def grdnt_mu_and_var(theta, df, c_score, l_predictors):
     i_split = int(1 + (len(theta) - 2) / 2)
     beta_mu = theta[0:i_split]
     beta_var = theta[i_split:]
-    x = df[c_score]
-
-    pred_var = f_var(df[l_predictors], beta_var)  # current prediction of variance
-
-    mu_coeff = -(x - f_mu(df[l_predictors], beta_mu)) / f_var(
-        df[l_predictors], beta_var
-    )
-    sig_coeff = 1 / (2 * f_var(df[l_predictors], beta_var)) - (1 / 2) * (
-        x - f_mu(df[l_predictors], beta_mu)
-    ) ** 2 / (f_var(df[l_predictors], beta_var) ** 2)
-
-    grad = np.concatenate(
-        [
-            [sum(mu_coeff * 1)],
-            [sum(mu_coeff * df[x]) for x in l_predictors],
-            [sum(sig_coeff * (1 * pred_var))],
-            [sum(sig_coeff * (df[x] * pred_var)) for x in l_predictors],
-        ]
-    )
+    x = df[c_score].to_numpy()
+    predictors = df[l_predictors].to_numpy()
+
+    # predict once per iteration, the optimiser calls this hundreds of times
+    pred_var = f_var(predictors, beta_var)  # current prediction of variance
+    resid = x - f_mu(predictors, beta_mu)
+
+    mu_coeff = -resid / pred_var
+    sig_coeff = 1 / (2 * pred_var) - (1 / 2) * resid**2 / (pred_var**2)
+
+    # fill the gradient in place, summing over samples for all predictors at once
+    grad = np.empty(len(theta))
+    grad[0] = np.sum(mu_coeff)
+    grad[1:i_split] = mu_coeff @ predictors
+    grad[i_split] = np.sum(sig_coeff * pred_var)
+    grad[i_split + 1 :] = (sig_coeff * pred_var) @ predictors
 
     return grad
 
@@ -1,3 +1,4 @@
+import concurrent.futures
 import dataclasses
 import gzip
 import logging
@@ -6,12 +7,6 @@ import typing
 
 import pandas as pd
 
-from ._ancestry.tools import (
-    compare_ancestry,
-    choose_pval_threshold,
-    pgs_adjust,
-    write_model,
-)
 from .principalcomponents import PopulationType
 from ._ancestry import read
 
@@ -64,6 +59,8 @@ class AdjustResults:
 
     def _write_model(self, directory):
         """Write results to a directory"""
+        from ._ancestry.tools import write_model
+
         directory = pathlib.Path(directory)
         write_model(
             {"pgs": self.models, "compare_pcs": self.model_meta},
@@ -71,38 +68,30 @@ class AdjustResults:
         )
 
     def _write_pgs(self, directory):
-        scorecols = self.scorecols
         directory = pathlib.Path(directory)
         loc_pgs_out = str(directory / f"{self.target_label}_pgs.txt.gz")
-        with gzip.open(loc_pgs_out, "wt") as outf:
-            logger.debug(
-                "Writing adjusted PGS values (long format) to: {}".format(loc_pgs_out)
+        logger.debug(
+            "Writing adjusted PGS values (long format) to: {}".format(loc_pgs_out)
+        )
+        # reshape every score at once, instead of melting and pivoting each score
+        df_pgs = self.pgs.melt(ignore_index=False)
+        df_pgs[["method", "PGS"]] = df_pgs.variable.str.split("|", expand=True)
+        df_pgs = (
+            df_pgs.drop("variable", axis=1)
+            .reset_index()
+            .pivot(
+                index=["sampleset", "IID", "PGS"],
+                columns="method",
+                values="value",
             )
-            for i, pgs_id in enumerate(scorecols):
-                df_pgs = self.pgs.loc[:, self.pgs.columns.str.endswith(pgs_id)].melt(
-                    ignore_index=False
-                )  # filter to 1 PGS
-                df_pgs[["method", "PGS"]] = df_pgs.variable.str.split("|", expand=True)
-                df_pgs = (
-                    df_pgs.drop("variable", axis=1)
-                    .reset_index()
-                    .pivot(
-                        index=["sampleset", "IID", "PGS"],
-                        columns="method",
-                        values="value",
-                    )
-                )
-                if i == 0:
-                    logger.debug(
-                        "{}/{}: Writing {}".format(i + 1, len(scorecols), pgs_id)
-                    )
-                    colorder = list(df_pgs.columns)  # to ensure sort order
-                    df_pgs.to_csv(outf, sep="\t")
-                else:
-                    logger.debug(
-                        "{}/{}: Appending {}".format(i + 1, len(scorecols), pgs_id)
-                    )
-                    df_pgs[colorder].to_csv(outf, sep="\t", header=False)
+        )
+        # pivot sorts by sample, but output is grouped by score (in scorecols order)
+        pgs_order = pd.Categorical(
+            df_pgs.index.get_level_values("PGS"), categories=self.scorecols
+        )
+        df_pgs = df_pgs.iloc[pgs_order.codes.argsort(kind="stable")]
+        with gzip.open(loc_pgs_out, "wt") as outf:
+            df_pgs.to_csv(outf, sep="\t")
 
 
 class AggregatedPGS:
@@ -143,18 +132,19 @@ class AggregatedPGS:
 
     def _check_overlap(self, ref_pc, target_pc):
         """Before adjusting, there should be perfect target sample overlap"""
-        pca_ref_samples = set(ref_pc.df.index.get_level_values(1))
-        pca_target_samples = set(target_pc.df.index.get_level_values(1))
-        score_ref_samples = set(self.df.loc["reference"].index)
-        score_target_samples = set(self.df.loc[self.target_name].index)
+        # Index.isin hashes the scored samples once instead of copying to sets
+        pca_ref_samples = ref_pc.df.index.get_level_values(1)
+        pca_target_samples = target_pc.df.index.get_level_values(1)
+        score_ref_samples = self.df.loc["reference"].index
+        score_target_samples = self.df.loc[self.target_name].index
 
-        if not pca_ref_samples.issubset(score_ref_samples):
+        if not pca_ref_samples.isin(score_ref_samples).all():
             logger.critical(
                 "Error: PGS data missing for reference samples with PCA data"
             )
             raise ValueError
 
-        if not pca_target_samples.issubset(score_target_samples):
+        if not pca_target_samples.isin(score_target_samples).all():
             logger.critical("Error: PGS data missing for target samples with PCA data.")
             raise ValueError
 
@@ -184,6 +174,10 @@ class AggregatedPGS:
         >>> sorted(os.listdir(dout))
         ['target_info.json.gz', 'target_pgs.txt.gz', 'target_popsimilarity.txt.gz']
         """
+        # sklearn and scipy are slow to import and only needed to adjust scores,
+        # so importing them here keeps aggregating scores quick to start
+        from ._ancestry.tools import compare_ancestry, choose_pval_threshold, pgs_adjust
+
         if adjust_arguments is None:
             adjust_arguments = AdjustArguments()  # uses default values
 
@@ -223,7 +217,7 @@ class AggregatedPGS:
         reference_df = pd.concat([reference_df, ancestry_ref], axis=1)
         target_df = pd.concat([target_df, ancestry_target], axis=1)
 
-        if (ref_norm := ref_pc.npcs_norm) != (target_norm := ref_pc.npcs_norm):
+        if (ref_norm := ref_pc.npcs_norm) != (target_norm := target_pc.npcs_norm):
             logger.warning(
                 f"Reference PC: {ref_norm=} doesn't match {target_norm=}. Taking min()"
             )
@@ -360,14 +354,20 @@ class PolygenicScore:
         if self.path is None:
             raise ValueError("Missing path")
 
+        # only parse the columns that get aggregated, plink2 also writes an _AVG
+        # column per score and optional sample metadata which are thrown away
         df = (
-            pd.read_csv(self.path, sep="\t", converters={"IID": str})
+            pd.read_csv(
+                self.path,
+                sep="\t",
+                converters={"IID": str},
+                usecols=lambda x: x == "#IID" or _is_agg_col(x),
+            )
             .assign(sampleset=self.sampleset)
             .set_index(["sampleset", "#IID"])
         )
 
         df.index.names = ["sampleset", "IID"]
-        df = df[_select_agg_cols(df.columns)]
         return df
 
     def average(self):
@@ -383,14 +383,14 @@ class PolygenicScore:
     def melt(self):
         """Update the dataframe with a melted version (wide format to long format)"""
         logger.info("Melting dataframe from wide to long format")
-        df = self.df.melt(
+        # e.g. PGS000822_SUM -> PGS000822
+        # rename the columns before melting to replace a few strings, not one per row
+        df = self.df.rename(columns=lambda x: x.replace("_SUM", "")).melt(
             id_vars=["DENOM"],
             value_name="SUM",
             var_name="PGS",
             ignore_index=False,
         )
-        # e.g. PGS000822_SUM -> PGS000822
-        df["PGS"] = df["PGS"].str.replace("_SUM", "")
         # melted chunks need a consistent column order
         self._df = df[["PGS", "SUM", "DENOM"]]
         self._melted = True
@@ -407,20 +407,31 @@ class PolygenicScore:
         if split:
             logger.info("Writing results split by sampleset")
 
-            for sampleset, group in df.groupby("sampleset"):
-                fout = outdir / f"{sampleset}_pgs.txt.gz"
-                df.to_csv(fout, sep="\t", compression="gzip", mode="a")
+            # each sampleset is written to a different file, and gzip compression
+            # releases the GIL, so write samplesets at the same time in threads
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                futures = [
+                    executor.submit(
+                        group.to_csv,
+                        outdir / f"{sampleset}_pgs.txt.gz",
+                        sep="\t",
+                        compression="gzip",
+                        mode="a",
+                    )
+                    for sampleset, group in df.groupby("sampleset")
+                ]
+                for future in futures:
+                    # important to grab result to raise exceptions
+                    future.result()
         else:
             logger.info("Writing combined results (aggregated_scores.txt.gz)")
             fout = outdir / "aggregated_scores.txt.gz"
             df.to_csv(fout, sep="\t", compression="gzip", mode="a")
 
 
-def _select_agg_cols(cols):
-    """Select aggregatable columns"""
+def _is_agg_col(col):
+    """Is a column aggregatable?"""
     keep_cols = ["DENOM"]
-    return [
-        x
-        for x in cols
-        if (x.endswith("_SUM") and (x != "NAMED_ALLELE_DOSAGE_SUM")) or (x in keep_cols)
-    ]
+    return (col.endswith("_SUM") and (col != "NAMED_ALLELE_DOSAGE_SUM")) or (
+        col in keep_cols
+    )
@@ -110,13 +110,20 @@ class PrincipalComponents:
 
     @property
     def npcs_norm(self):
-        """Number of PCs used for population normalization (default = 4)"""
+        """Number of PCs used for population normalization (default = 4)
+
+        >>> from ._config import Config
+        >>> target_pcs = PrincipalComponents(pcs_path=Config.ROOT_DIR / "tests" / "data" / "target.pcs", dataset="target", pop_type=PopulationType.TARGET)
+        >>> target_pcs.npcs_norm = 8
+        >>> target_pcs.npcs_norm, target_pcs.npcs_popcomp
+        (8, 5)
+        """
         return self._npcs_norm
 
     @npcs_norm.setter
     def npcs_norm(self, value):
         if 1 <= value <= 20:
-            self._npcs_popcomp = int(value)
+            self._npcs_norm = int(value)
         else:
             raise ValueError("Must be integer between 1 and 20")
 
@@ -62,3 +62,24 @@ def test_nosplit_aggregate(tmp_path_factory, scorefiles, expected_output_columns
     outdf = pd.read_csv(outf[0], sep="\t")
     assert list(outdf.columns) == expected_output_columns
     assert outdf.shape == (929, len(expected_output_columns))
+
+
+def test_split_multiple_samplesets(tmp_path_factory, request):
+    """Test splitting aggregated scores from two samplesets (hgdp and cineca).
+    Each output file should only contain its own sampleset"""
+    outdir = tmp_path_factory.mktemp("outdir")
+    scorefiles = glob.glob(str(request.path.parent / "data" / "*.sscore.zst"))
+
+    args = [
+        ("pgscatalog-aggregate", "-s", *scorefiles, "--outdir", str(outdir), "--split")
+    ]
+    flargs = list(itertools.chain(*args))
+
+    with patch("sys.argv", flargs):
+        run_aggregate()
+
+    outf = sorted(outdir.glob("*.txt.gz"))
+    assert [x.name for x in outf] == ["cineca_pgs.txt.gz", "hgdp_pgs.txt.gz"]
+    for path in outf:
+        outdf = pd.read_csv(path, sep="\t")
+        assert set(outdf["sampleset"]) == {path.name.split("_")[0]}
@@ -16,25 +16,25 @@ logger = logging.getLogger(__name__)
 
 def get_variant_log(batch):
     # these statistics can only be generated while iterating through variants
-    n_variants = collections.Counter("n_variants" for item in batch)
-    hm_source = collections.Counter(getattr(item, "hm_source") for item in batch)
-    return n_variants + hm_source
+    # one pass counts sources, the batch length is the number of variants
+    variant_log = collections.Counter(item.hm_source for item in batch)
+    variant_log["n_variants"] = len(batch)
+    return variant_log
+
+
+def normalise(scorefile, **kwargs):
+    """Normalise a scoring file and count its variant sources
+
+    Runs in a worker process, so the variants are returned in a list"""
+    normalised_score = list(scorefile.normalise(**kwargs))
+    return normalised_score, get_variant_log(normalised_score)
 
 
 class DataWriter:
     def __init__(self, filename):
         self.filename = filename
-        self.fieldnames = [
-            "chr_name",
-            "chr_position",
-            "effect_allele",
-            "other_allele",
-            "effect_weight",
-            "effect_type",
-            "is_duplicated",
-            "accession",
-            "row_nr",
-        ]
+        # rows are written by iterating over ScoreVariants, so the header must match
+        self.fieldnames = ScoreVariant.output_fields
         logger.info(f"Output filename: {filename}")
 
     def write(self, batch):
@@ -62,6 +62,6 @@ class TextFileWriter(DataWriter):
                 lineterminator="\n",
             )
             if mode == "wt":
-                writer.writerow(ScoreVariant.output_fields)
+                writer.writerow(self.fieldnames)
 
             writer.writerows(batch)
@@ -1,4 +1,6 @@
 import argparse
+import collections
+import concurrent.futures
 import json
 import logging
 import pathlib
@@ -8,10 +10,14 @@ import textwrap
 from tqdm import tqdm
 from pgscatalog.core import GenomeBuild, ScoringFile
 
-from pgscatalog.core.cli._combine import get_variant_log, TextFileWriter
+from pgscatalog.core.cli._combine import normalise, TextFileWriter
 
 logger = logging.getLogger(__name__)
 
+# normalised scoring files are held in memory until they're written, so never
+# have more than a few in flight, however many workers are requested
+_MAX_PENDING = 4
+
 
 def run():
     args = parse_args()
@@ -35,7 +41,8 @@ def run():
             logger.debug("Not compressing output")
             compress_output = False
 
-    paths = list(set(args.scorefiles))  # unique paths only
+    # unique paths only, in input order so scores with the same pgs_id stay ordered
+    paths = list(dict.fromkeys(args.scorefiles))
     scoring_files = sorted([ScoringFile(x) for x in paths], key=lambda x: x.pgs_id)
     target_build = GenomeBuild.from_string(args.target_build)
 
@@ -60,19 +67,17 @@ def run():
     else:
         liftover_kwargs = {"liftover": False}
 
-    for scorefile in tqdm(scoring_files, total=len(scoring_files)):
-        logger.info(f"Processing {scorefile.pgs_id}")
-        normalised_score = list(
-            scorefile.normalise(
-                drop_missing=args.drop_missing,
-                **liftover_kwargs,
-                target_build=target_build,
-            )
-        )
-        # TODO: go back to concurrent execution + write to multiple files
-        writer = TextFileWriter(compress=compress_output, filename=out_path)
+    normalise_kwargs = {
+        "drop_missing": args.drop_missing,
+        **liftover_kwargs,
+        "target_build": target_build,
+    }
+    n_workers = min(args.threads, _MAX_PENDING, len(scoring_files))
+    writer = TextFileWriter(compress=compress_output, filename=out_path)
+    normalised = _normalise_all(scoring_files, n_workers, **normalise_kwargs)
+    for normalised_score, log in tqdm(normalised, total=len(scoring_files)):
         writer.write(normalised_score)
-        variant_log.append(get_variant_log(normalised_score))
+        variant_log.append(log)
 
     score_log = []
     for sf, log in zip(scoring_files, variant_log, strict=True):
@@ -86,6 +91,28 @@ def run():
     logger.info("Combining complete")
 
 
+def _normalise_all(scoring_files, n_workers, **kwargs):
+    """Normalise scoring files, yielding (variants, variant log) in input order"""
+    if n_workers <= 1:
+        for scorefile in scoring_files:
+            logger.info(f"Processing {scorefile.pgs_id}")
+            yield normalise(scorefile, **kwargs)
+        return
+
+    # normalising is CPU bound, so normalise scoring files in worker processes
+    # results are yielded in submission order, so the output matches a serial run
+    pending = collections.deque()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for scorefile in scoring_files:
+            logger.info(f"Processing {scorefile.pgs_id}")
+            pending.append(executor.submit(normalise, scorefile, **kwargs))
+            if len(pending) >= n_workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
 _description_text = textwrap.dedent(
     """
     Combine multiple scoring files in PGS Catalog format (see 
@@ -175,6 +202,15 @@ def parse_args(args=None):
         help="<Required> Name for the log file (score metadata) for combined scores."
         "[ will write to identical directory as combined scorefile]",
     )
+    parser.add_argument(
+        "-n",
+        "--threads",
+        dest="threads",
+        type=int,
+        default=1,
+        help="<Optional> Number of scoring files to normalise in parallel "
+        f"[ default: 1, at most {_MAX_PENDING} to limit memory use ]",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -2,6 +2,7 @@
 HTTPS download is preferred, with FTP fallback available.
 """
 
+import functools
 import hashlib
 import logging
 import os
@@ -14,6 +15,7 @@ import httpx
 
 from .pgsexceptions import ScoreDownloadError, ScoreChecksumError
 from ._config import Config
+from ._http import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -66,16 +68,17 @@ def ftp_fallback(retry_state):
     try:
         with (
             tempfile.NamedTemporaryFile(dir=directory, delete=False) as score_f,
-            tempfile.NamedTemporaryFile(dir=directory, delete=True) as checksum_f,
+            urllib.request.urlopen(ftp_url) as r,
         ):
-            urllib.request.urlretrieve(ftp_url, score_f.name)
-            urllib.request.urlretrieve(checksum_url, checksum_f.name)
+            # checksum while streaming, instead of reading the whole file back later
+            for data in iter(functools.partial(r.read, 1024 * 1024), b""):
+                score_f.write(data)
+                md5.update(data)
 
-            md5.update(score_f.read())
+            with urllib.request.urlopen(checksum_url) as checksum_r:
+                remote = checksum_r.read().decode().split()[0]
 
-            if (checksum := md5.hexdigest()) != (
-                remote := checksum_f.read().decode().split()[0]
-            ):
+            if (checksum := md5.hexdigest()) != remote:
                 raise ScoreChecksumError(
                     f"Local checksum {checksum} doesn't match remote {remote}"
                 )
@@ -87,8 +90,36 @@ def ftp_fallback(retry_state):
         logger.info(f"FTP download OK, {out_path} checksum validation passed")
 
 
+def file_missing(retry_state):
+    """Stop retrying HTTPS downloads when the server says a file doesn't exist.
+    Retrying can't fix a missing file, so it's better to fall back to FTP immediately.
+    This function should be used as a stop callback from a tenacity.retry decorator:
+
+    >>> request = httpx.Request("GET", "https://example.com/PGS000001.txt.gz")
+    >>> exc = ScoreDownloadError("HTTPS download failed")
+    >>> exc.__cause__ = httpx.HTTPStatusError("", request=request, response=httpx.Response(404, request=request))
+    >>> retry_state = tenacity.RetryCallState(retry_object=None, fn=None, args=None, kwargs=None)
+    >>> retry_state.set_exception((type(exc), exc, None))
+    >>> file_missing(retry_state)
+    True
+
+    Other errors (e.g. server errors or timeouts) are retried:
+
+    >>> exc.__cause__ = httpx.HTTPStatusError("", request=request, response=httpx.Response(503, request=request))
+    >>> retry_state.set_exception((type(exc), exc, None))
+    >>> file_missing(retry_state)
+    False
+    """
+    cause = retry_state.outcome.exception().__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        return cause.response.status_code in (404, 410)
+    return False
+
+
 @tenacity.retry(
-    stop=tenacity.stop_after_attempt(Config.MAX_RETRIES),
+    stop=tenacity.stop_any(
+        tenacity.stop_after_attempt(Config.MAX_RETRIES), file_missing
+    ),
     retry=tenacity.retry_if_exception_type((ScoreDownloadError, ScoreChecksumError)),
     retry_error_callback=ftp_fallback,
     wait=tenacity.wait_fixed(3) + tenacity.wait_random(0, 2),
@@ -107,11 +138,17 @@ def https_download(*, url, out_path, directory, overwrite):
             raise FileExistsError(f"{out_path} already exists")
 
         checksum_path = url + ".md5"
-        checksum = httpx.get(checksum_path, headers=Config.API_HEADER).text
+        checksum = (
+            http_client()
+            .get(checksum_path, headers=Config.API_HEADER)
+            .raise_for_status()
+            .text
+        )
         md5 = hashlib.md5()
 
         with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
-            with httpx.stream("GET", url, headers=Config.API_HEADER) as r:
+            with http_client().stream("GET", url, headers=Config.API_HEADER) as r:
+                r.raise_for_status()
                 for data in r.iter_bytes():
                     f.write(data)
                     md5.update(data)
@@ -123,7 +160,7 @@ def https_download(*, url, out_path, directory, overwrite):
                 )
     except httpx.UnsupportedProtocol as protocol_exc:
         raise ValueError(f"Can't download a local file: {url!r}") from protocol_exc
-    except httpx.RequestError as download_exc:
+    except (httpx.RequestError, httpx.HTTPStatusError) as download_exc:
         raise ScoreDownloadError("HTTPS download failed") from download_exc
     else:
         # no exceptions thrown, move the temporary file to the final output path
@@ -0,0 +1,20 @@
+"""This module contains a HTTP client that's shared by PGS Catalog API queries and
+downloads, so connections are reused instead of opened for every request."""
+
+import functools
+
+import httpx
+
+
+@functools.cache
+def http_client():
+    """Return a thread-safe :class:`httpx.Client` that pools connections
+
+    Module level ``httpx.get()`` creates a new client for each request, which means
+    a new TCP connection and TLS handshake every time. The PGS Catalog is queried in
+    chunks and downloads fetch a checksum and a scoring file, so reuse connections:
+
+    >>> http_client() is http_client()
+    True
+    """
+    return httpx.Client()
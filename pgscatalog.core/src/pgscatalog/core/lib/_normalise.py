@@ -3,7 +3,9 @@ standard way. Each step in the data processing pipeline is a generator that oper
 on a list of ScoreVariants and yields updated ScoreVariants. This makes it easy to
 plug in extra steps where needed, and lazily works on millions of objects."""
 
+import functools
 import logging
+import operator
 import pathlib
 
 import pyliftover
@@ -14,6 +16,9 @@ from .pgsexceptions import LiftoverError
 
 logger = logging.getLogger(__name__)
 
+# HLA alleles are written as present / absent
+_HLA_ALLELES = frozenset((EffectAllele("P"), EffectAllele("N")))
+
 
 def normalise(
     scoring_file, drop_missing=False, liftover=False, chain_dir=None, target_build=None
@@ -53,7 +58,8 @@ def normalise(
 
     if scoring_file.is_wide:
         # wide data must be sorted because check_duplicates requires sorted input
-        variants = (x for x in sorted(variants, key=lambda x: x["accession"]))
+        # ScoreVariants aren't subscriptable, and attrgetter skips a lambda call per row
+        variants = (x for x in sorted(variants, key=operator.attrgetter("accession")))
 
     variants = check_duplicates(variants)
 
@@ -64,7 +70,7 @@ def check_duplicates(variants):
     """Check if a scoring file contains multiple variants with the same ID
     ID = chr:pos:effect_allele:other_allele
     """
-    seen_ids = {}
+    seen_ids = set()
     current_accession = None
     n_duplicates = 0
     n_variants = 0
@@ -72,22 +78,21 @@ def check_duplicates(variants):
         accession = variant.accession
 
         if accession != current_accession:
-            seen_ids = {}
+            seen_ids = set()
             current_accession = accession
 
         # None other allele -> empty string
-        variant_id: str = ":".join(
-            [
-                str(getattr(variant, k) or "")
-                for k in ["chr_name", "chr_position", "effect_allele", "other_allele"]
-            ]
+        # one f-string instead of a list of getattr() calls joined for every variant
+        variant_id: str = (
+            f"{variant.chr_name or ''}:{variant.chr_position or ''}:"
+            f"{variant.effect_allele or ''}:{variant.other_allele or ''}"
         )
 
         if variant_id in seen_ids:
             variant.is_duplicated = True
             n_duplicates += 1
 
-        seen_ids[variant_id] = True
+        seen_ids.add(variant_id)
 
         yield variant
         n_variants += 1
@@ -112,7 +117,7 @@ def drop_hla(variants):
     n_dropped = 0
     for variant in variants:
         match variant:
-            case _ if variant.effect_allele in (EffectAllele("P"), EffectAllele("N")):
+            case _ if variant.effect_allele in _HLA_ALLELES:
                 n_dropped += 1
                 continue
             case _:
@@ -332,13 +337,23 @@ def lift(
 
         n_lifted = 0
         n = 0
+        # lifted coordinates land on a handful of contigs (e.g. chr6_ssto_hap7), so
+        # normalise each contig name once with a dict lookup instead of every variant
+        lifted_chroms = {}
+        # the same goes for UCSC chromosome names: reusing one string per chromosome
+        # also means pyliftover's chain lookups don't hash a new string every variant
+        ucsc_chroms = {}
 
         for variant in variants:
-            chrom = "chr" + variant.chr_name  # ew
+            if (chrom := ucsc_chroms.get(variant.chr_name)) is None:
+                chrom = ucsc_chroms[variant.chr_name] = "chr" + variant.chr_name  # ew
             pos = int(variant.chr_position) - 1  # VCF -> 1 based, UCSC -> 0 based
             lifted = lo.convert_coordinate(chrom, pos)
             if lifted:
-                variant.chr_name = lifted[0][0][3:].split("_")[0]
+                contig = lifted[0][0]
+                if (chr_name := lifted_chroms.get(contig)) is None:
+                    chr_name = lifted_chroms[contig] = contig[3:].split("_")[0]
+                variant.chr_name = chr_name
                 variant.chr_position = lifted[0][1] + 1  # reverse 0 indexing
                 yield variant
                 n_lifted += 1
@@ -354,6 +369,7 @@ def lift(
             logger.info("Liftover successful")
 
 
+@functools.cache
 def load_chain(*, current_build, target_build, chain_dir):
     """Only supports loading GRCh37 and GRCh38 chain files
 
@@ -362,6 +378,12 @@ def load_chain(*, current_build, target_build, chain_dir):
     >>> load_chain(current_build=GenomeBuild.GRCh37, target_build=GenomeBuild.GRCh38, chain_dir=chain_dir) # doctest: +ELLIPSIS
     <pyliftover.liftover.LiftOver object at...
 
+    Parsing chain files is slow, so each chain is only loaded once:
+
+    >>> lo = load_chain(current_build=GenomeBuild.GRCh37, target_build=GenomeBuild.GRCh38, chain_dir=chain_dir)
+    >>> lo is load_chain(current_build=GenomeBuild.GRCh37, target_build=GenomeBuild.GRCh38, chain_dir=chain_dir)
+    True
+
     >>> load_chain(current_build=GenomeBuild.GRCh38, target_build=GenomeBuild.GRCh37, chain_dir=chain_dir) # doctest: +ELLIPSIS
     <pyliftover.liftover.LiftOver object at...
 
@@ -15,14 +15,14 @@ def read_rows_lazy(
     *, csv_reader, fields: list[str], name: str, wide: bool, row_nr: int
 ):
     """Read rows from an open scoring file and instantiate them as ScoreVariants"""
+    # effect weight columns only depend on the header, so find them once, not per row
+    weight_names: list[str] = [x for x in fields if "effect_weight_" in x]
+
     for row in csv_reader:
         variant = dict(zip(fields, row))
 
         if wide:
-            ew_col_idxs: list[int] = [
-                i for i, x in enumerate(["effect_weight_" in x for x in fields]) if x
-            ]
-            for i, weight_name in zip(ew_col_idxs, [fields[i] for i in ew_col_idxs]):
+            for weight_name in weight_names:
                 yield ScoreVariant(
                     **variant,
                     **{
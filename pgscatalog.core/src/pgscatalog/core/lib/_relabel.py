@@ -11,6 +11,9 @@ from xopen import xopen
 
 logger = logging.getLogger(__name__)
 
+# csv.DictWriter's default, relabelled files have always been written with it
+_LINETERMINATOR = "\r\n"
+
 
 def _read_map(in_map, col_from, col_to):
     """Read a column from a mapping file into a dictionary"""
@@ -83,25 +86,32 @@ def relabel_write(relabelled, dataset, split_output, combined_output, out_dir):
     for i, (chrom, group) in enumerate(itertools.groupby(relabelled, _parse_chrom)):
         # grab a batch of relabelled lines, grouped by chromosome
         batch = list(group)
-        fieldnames = batch[0].keys()
+        header = "\t".join(batch[0].keys()) + _LINETERMINATOR
+        # fields were split on tabs, so they can be joined back without csv quoting
+        # the joined lines are shared by the split and combined outputs
+        # short rows are missing fields (None), which are written as empty strings
+        lines = "".join(
+            [
+                "\t".join(v or "" for v in line.values()) + _LINETERMINATOR
+                for line in batch
+            ]
+        )
 
         if split_output:
             outf_path = out_dir / _get_outf_path(chrom=chrom, dataset=dataset)
             logger.debug(f"Writing chrom {chrom} to {outf_path}")
 
-            with gzip.open(outf_path, "wt") as csv_file:
-                writer = csv.DictWriter(csv_file, delimiter="\t", fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(batch)
+            with gzip.open(outf_path, "wt") as out_f:
+                out_f.write(header)
+                out_f.write(lines)
 
         if combined_output:
             logger.debug(f"Appending to {combined_output}")
-            with gzip.open(combined_output, "at") as csv_file:
-                writer = csv.DictWriter(csv_file, delimiter="\t", fieldnames=fieldnames)
+            with gzip.open(combined_output, "at") as out_f:
                 if i == 0:
-                    writer.writeheader()
+                    out_f.write(header)
 
-                writer.writerows(batch)
+                out_f.write(lines)
 
 
 RelabelArgs = namedtuple(
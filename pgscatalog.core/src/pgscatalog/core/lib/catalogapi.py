@@ -9,6 +9,7 @@ import tenacity
 from .pgsexceptions import QueryError, InvalidAccessionError
 from .genomebuild import GenomeBuild
 from ._config import Config
+from ._http import http_client
 
 
 logger = logging.getLogger(__name__)
@@ -219,7 +220,11 @@ class CatalogQuery:
                 results = []
 
                 for url in self.get_query_url():
-                    r = httpx.get(url, timeout=5, headers=Config.API_HEADER).json()
+                    r = (
+                        http_client()
+                        .get(url, timeout=5, headers=Config.API_HEADER)
+                        .json()
+                    )
 
                     if "request limit exceeded" in r.get("message", ""):
                         raise httpx.RequestError("request limit exceeded")
@@ -242,7 +247,7 @@ class CatalogQuery:
                         raise ValueError
             case CatalogCategory.PUBLICATION:
                 url = self.get_query_url()
-                r = httpx.get(url, timeout=5, headers=Config.API_HEADER).json()
+                r = http_client().get(url, timeout=5, headers=Config.API_HEADER).json()
                 try:
                     pgs_ids = [
                         score
@@ -257,7 +262,7 @@ class CatalogQuery:
                     return CatalogQuery(accession=pgs_ids).score_query()
             case CatalogCategory.TRAIT:
                 url = self.get_query_url()
-                r = httpx.get(url, timeout=5, headers=Config.API_HEADER).json()
+                r = http_client().get(url, timeout=5, headers=Config.API_HEADER).json()
                 pgs_ids = r["associated_pgs_ids"]
                 if self.include_children:
                     pgs_ids.extend(r["child_associated_pgs_ids"])
@@ -1,6 +1,8 @@
 """This module contains classes that compose a ScoreVariant: a variant in a PGS
 Catalog Scoring File."""
 
+import functools
+import operator
 from enum import Enum
 from typing import Optional
 
@@ -28,7 +30,7 @@ class EffectAllele:
     False
     """
 
-    _valid_snp_bases = frozenset({"A", "C", "T", "G"})
+    _valid_snp_bases = "ACTG"
     __slots__ = ("_allele", "_is_snp")
 
     def __init__(self, allele):
@@ -65,9 +67,17 @@ class EffectAllele:
         True
         """
         if self._is_snp is None:
-            self._is_snp = not frozenset(self.allele) - self._valid_snp_bases
+            self._is_snp = self._check_snp(self.allele)
         return self._is_snp
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _check_snp(allele):
+        # scoring files repeat a handful of alleles millions of times, so check
+        # each distinct allele once instead of building a set for every variant
+        # stripping valid bases leaves nothing behind only if every base is valid
+        return not allele.strip(EffectAllele._valid_snp_bases)
+
     def __eq__(self, other):
         if isinstance(other, EffectAllele):
             return self.allele == other.allele
@@ -150,6 +160,9 @@ class ScoreVariant:
         "row_nr",
     )
 
+    # fetches every output field in one call, instead of a getattr loop per variant
+    _get_output_fields = operator.attrgetter(*output_fields)
+
     # slots uses magic to improve speed and memory when making millions of objects
     __slots__ = mandatory_fields + optional_fields + ("is_complex",)
 
@@ -247,5 +260,4 @@ class ScoreVariant:
         return f"{class_name}({params})"
 
     def __iter__(self):
-        for attr in self.output_fields:
-            yield getattr(self, attr)
+        return iter(self._get_output_fields(self))
@@ -4,6 +4,7 @@ genomes."""
 
 import enum
 import csv
+import operator
 import pathlib
 
 from xopen import xopen
@@ -20,6 +21,9 @@ class TargetVariant:
     True
     """
 
+    # target files contain millions of variants, so keep each instance small
+    __slots__ = ("chrom", "pos", "ref", "alt", "id")
+
     def __init__(self, *, chrom, pos, ref, alt, id):
         self.chrom = chrom
         self.pos = int(pos)
@@ -158,30 +162,23 @@ def read_pvar(path):
             else:
                 fieldnames = line.strip().split("\t")
                 break
-        reader = csv.DictReader(f, fieldnames=fieldnames, delimiter="\t")
-        fields = {
-            "#CHROM": "chrom",
-            "POS": "pos",
-            "REF": "ref",
-            "ALT": "alt",
-            "ID": "id",
-        }
-        for row in reader:
-            yield TargetVariant(**{v: row[k] for k, v in fields.items()})
+        # look up column positions once instead of building a dict for each row
+        get_fields = operator.itemgetter(
+            *(fieldnames.index(k) for k in ("#CHROM", "POS", "REF", "ALT", "ID"))
+        )
+        for row in csv.reader(f, delimiter="\t"):
+            chrom, pos, ref, alt, id = get_fields(row)
+            yield TargetVariant(chrom=chrom, pos=pos, ref=ref, alt=alt, id=id)
 
 
 def read_bim(path):
     """Read plink1 bim variant information files using python core library"""
     with xopen(path, "rt") as f:
         # bims don't have header column
-        reader = csv.reader(f, delimiter="\t")
         # yes, A1/A2 in bim isn't ref/alt
-        fields = ["chrom", "id", "pos_cm", "pos", "ref", "alt"]
-        for row in reader:
-            row = dict(zip(fields, row, strict=True))
-            yield TargetVariant(
-                **{k: row[k] for k in ("chrom", "pos", "ref", "alt", "id")}
-            )
+        # unpacking rows checks the number of columns
+        for chrom, id, _, pos, ref, alt in csv.reader(f, delimiter="\t"):
+            yield TargetVariant(chrom=chrom, pos=pos, ref=ref, alt=alt, id=id)
 
 
 class TargetType(enum.Enum):
@@ -153,3 +153,59 @@ def test_liftover(tmp_path, chain_dir, lift_scorefiles):
         lifted_pos = [row["chr_position"] for row in lifted_reader]
 
     assert all([int(x) == int(y) for x, y in zip(known_good, lifted_pos, strict=True)])
+
+
+def test_combine_wide(tmp_path):
+    """Test combining a custom scoring file with multiple effect weight columns.
+    Each effect weight column becomes an accession in the long output"""
+    score_path = tmp_path / "wide.txt"
+    score_path.write_text(
+        "#pgs_id=wide\n#pgs_name=wide\n#trait_reported=test\n#genome_build=GRCh37\n"
+        "chr_name\tchr_position\teffect_allele\tother_allele\teffect_weight_a\teffect_weight_b\n"
+        "1\t100\tA\tC\t0.1\t0.2\n"
+        "1\t200\tG\tT\t0.3\t0.4\n"
+    )
+    out_path = tmp_path / "combined.txt"
+    args = [
+        ("pgscatalog-combine", "-s", str(score_path)),
+        ("-o", str(out_path), "-t", "GRCh37"),
+    ]
+    flargs = list(itertools.chain(*args))
+
+    with patch("sys.argv", flargs):
+        run()
+
+    with open(out_path) as f:
+        results = list(csv.DictReader(f, delimiter="\t"))
+
+    assert [(x["accession"], x["effect_weight"]) for x in results] == [
+        ("effect_weight_a", "0.1"),
+        ("effect_weight_a", "0.3"),
+        ("effect_weight_b", "0.2"),
+        ("effect_weight_b", "0.4"),
+    ]
+
+
+def test_combine_threads(tmp_path, harmonised_scorefiles):
+    """Test normalising scoring files in worker processes.
+    The output should be identical to normalising one file at a time"""
+    paths = [str(x) for _, x in harmonised_scorefiles]
+    build = [str(x) for x, _ in harmonised_scorefiles][0]
+
+    outputs = []
+    for threads in ("1", "2"):
+        out_path = tmp_path / threads / "combined.txt"
+        out_path.parent.mkdir()
+        args = [
+            ("pgscatalog-combine", "-s"),
+            paths,
+            ("-o", str(out_path), "-t", build, "--threads", threads),
+        ]
+        flargs = list(itertools.chain(*args))
+
+        with patch("sys.argv", flargs):
+            run()
+
+        outputs.append(out_path.read_text())
+
+    assert outputs[0] == outputs[1]
@@ -65,3 +65,44 @@ def test_relabel(tmp_path_factory, relabel_scorefile, map_files):
                 assert "ID" in line
                 assert "effect_allele" in line
                 assert "PGS000802_hmPOS_GRCh38" in line
+
+
+def test_relabel_short_row(tmp_path_factory, map_files):
+    """Test relabelling a scorefile with a row missing its last field.
+    Missing fields are written as empty strings"""
+    out_dir = tmp_path_factory.mktemp("outdir")
+    scorefile = out_dir / "short.scorefile"
+    scorefile.write_text(
+        "ID\teffect_allele\tPGS000802_hmPOS_GRCh38\n"
+        "1:11796321:G:A\tA\t0.16\n"
+        "8:127401060:G:T\tG\n"
+    )
+
+    args = [
+        ("pgscatalog-relabel", "-m"),
+        map_files,
+        (
+            "--target_file",
+            str(scorefile),
+            "--target_col",
+            "ID",
+            "-d",
+            "hgdp",
+            "--col_from",
+            "ID_TARGET",
+            "--col_to",
+            "ID_REF",
+            "-o",
+            str(out_dir),
+            "--combined",
+        ),
+    ]
+    flargs = list(itertools.chain(*args))
+
+    with patch("sys.argv", flargs):
+        run()
+
+    with xopen(out_dir / "hgdp_ALL_relabelled.gz") as f:
+        lines = f.read().splitlines()
+
+    assert lines[-1].split("\t")[1:] == ["G", ""]
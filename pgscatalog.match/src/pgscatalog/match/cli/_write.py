@@ -57,5 +57,6 @@ def write_log(matchresults, score_df):
     matchresults.summary_log.write_csv(Config.OUTDIR / f"{Config.DATASET}_summary.csv")
 
     # this one can get big. gzip is slow, but everywhere
-    with gzip.open(logfname, "wb") as f:
+    # the log is repetitive text, so level 6 is much faster than 9 for ~2% more bytes
+    with gzip.open(logfname, "wb", compresslevel=6) as f:
         matchresults.full_variant_log(score_df=score_df).collect().write_csv(f)
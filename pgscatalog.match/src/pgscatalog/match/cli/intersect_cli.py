@@ -1,5 +1,6 @@
 import argparse
 import logging
+import os
 import pathlib
 
 from xopen import xopen
@@ -37,57 +38,46 @@ def run_intersect():
         count_var_r += 1
         ALTs = v["ALT"].split(",")
         IS_MA_REF = len(ALTs) > 1
+        # CHR:POS is shared by every allele, only the sorted alleles change per ALT
+        REF = v["REF"]
+        chrom_pos = f"{v['#CHROM']}:{v['POS']}"
         for i, ALT in enumerate(ALTs):
-            if v["REF"] < ALT:
-                key = "{}:{}:{}:{}".format(v["#CHROM"], v["POS"], v["REF"], ALT)
+            if REF < ALT:
+                key = f"{chrom_pos}:{REF}:{ALT}"
             else:
-                key = "{}:{}:{}:{}".format(v["#CHROM"], v["POS"], ALT, v["REF"])
+                key = f"{chrom_pos}:{ALT}:{REF}"
 
-            IS_INDEL = (len(v["REF"]) > 1) | (len(ALT) > 1)
-            STRANDAMB = v["REF"] == allele_complement(ALT)
-            ref_heap.append(
-                ([key, v["ID"], v["REF"]], [IS_INDEL, STRANDAMB, IS_MA_REF])
-            )
+            IS_INDEL = (len(REF) > 1) | (len(ALT) > 1)
+            # complements keep their length, so only same length alleles can match
+            STRANDAMB = len(REF) == len(ALT) and (REF == allele_complement(ALT))
+            # one flat tuple per allele sorts the same as nested key / value lists
+            ref_heap.append((key, v["ID"], REF, IS_INDEL, STRANDAMB, IS_MA_REF))
 
         if count_var_r % 500000 == 0:
-            heapq.heapify(ref_heap)
-            tmppath = tempfile.NamedTemporaryFile(dir=tmpdir, delete=False)
-            with open(tmppath.name, "wt") as outf:
-                o_tmp_r.append(tmppath.name)
+            # a sort is cheaper than heapify + popping every element
+            ref_heap.sort()
+            with tempfile.NamedTemporaryFile("wt", dir=tmpdir, delete=False) as outf:
+                o_tmp_r.append(outf.name)
                 outf.write(
                     "CHR:POS:A0:A1\tID_REF\tREF_REF\tIS_INDEL\tSTRANDAMB\tIS_MA_REF\n"
                 )
-                for i in range(len(ref_heap)):
-                    popped = heapq.heappop(ref_heap)
-                    outf.write(
-                        "\t".join([str(x) for x in popped[0] + popped[1]]) + "\n"
-                    )
+                for popped in ref_heap:
+                    outf.write("\t".join(map(str, popped)) + "\n")
             ref_heap = []
             logger.info("Processed {} REFERENCE variants".format(count_var_r))
 
     if len(ref_heap) > 0:
-        heapq.heapify(ref_heap)
-        tmppath = tempfile.NamedTemporaryFile(dir=tmpdir, delete=False)
-        with open(tmppath.name, "wt") as outf:
-            o_tmp_r.append(tmppath.name)
+        ref_heap.sort()
+        with tempfile.NamedTemporaryFile("wt", dir=tmpdir, delete=False) as outf:
+            o_tmp_r.append(outf.name)
             outf.write(
                 "CHR:POS:A0:A1\tID_REF\tREF_REF\tIS_INDEL\tSTRANDAMB\tIS_MA_REF\n"
             )
-            for i in range(len(ref_heap)):
-                popped = heapq.heappop(ref_heap)
-                outf.write("\t".join([str(x) for x in popped[0] + popped[1]]) + "\n")
+            for popped in ref_heap:
+                outf.write("\t".join(map(str, popped)) + "\n")
         del ref_heap
         logger.info("Processed {} REFERENCE variants".format(count_var_r))
 
-    logger.info("Outputting REFERNCE variants -> reference_variants.txt.gz")
-    with xopen(outdir / "reference_variants.txt.gz", "wt") as outf:
-        outf.write("CHR:POS:A0:A1\tID_REF\tREF_REF\tIS_INDEL\tSTRANDAMB\tIS_MA_REF\n")
-        for v in heapq.merge(
-            *[read_var_general(x) for x in o_tmp_r],
-            key=lambda v: (v["CHR:POS:A0:A1"], v["ID_REF"], v["REF_REF"]),
-        ):
-            outf.write("\t".join(v.values()) + "\n")
-
     # Process & sort target variants
     count_var_t = 0
     o_tmp_t = []
@@ -122,67 +112,79 @@ def run_intersect():
             ALT_FREQS = [float(x) for x in freq["ALT_FREQS"].split(",")]
             F_MISS_DOSAGE = miss["F_MISS_DOSAGE"]
             IS_MA_TARGET = len(ALTs) > 1
+            REF = v["REF"]
+            chrom_pos = f"{v['#CHROM']}:{v['POS']}"
             for i, ALT in enumerate(ALTs):
-                if v["REF"] < ALT:
-                    key = "{}:{}:{}:{}".format(v["#CHROM"], v["POS"], v["REF"], ALT)
+                if REF < ALT:
+                    key = f"{chrom_pos}:{REF}:{ALT}"
                 else:
-                    key = "{}:{}:{}:{}".format(v["#CHROM"], v["POS"], ALT, v["REF"])
+                    key = f"{chrom_pos}:{ALT}:{REF}"
                 target_heap.append(
                     (
-                        [key, v["ID"], v["REF"]],
-                        [IS_MA_TARGET, ALT_FREQS[i], F_MISS_DOSAGE],
+                        key,
+                        v["ID"],
+                        REF,
+                        IS_MA_TARGET,
+                        ALT_FREQS[i],
+                        F_MISS_DOSAGE,
                     )
                 )
 
             if count_var_t % 500000 == 0:
-                heapq.heapify(target_heap)
-                tmppath = tempfile.NamedTemporaryFile(dir=tmpdir, delete=False)
-                with open(tmppath.name, "wt") as outf:
-                    o_tmp_t.append(tmppath.name)
+                target_heap.sort()
+                with tempfile.NamedTemporaryFile(
+                    "wt", dir=tmpdir, delete=False
+                ) as outf:
+                    o_tmp_t.append(outf.name)
                     outf.write(
                         "CHR:POS:A0:A1\tID_TARGET\tREF_TARGET\tIS_MA_TARGET\tAAF\tF_MISS_DOSAGE\n"
                     )
-                    for i in range(len(target_heap)):
-                        popped = heapq.heappop(target_heap)
-                        outf.write(
-                            "\t".join([str(x) for x in popped[0] + popped[1]]) + "\n"
-                        )
+                    for popped in target_heap:
+                        outf.write("\t".join(map(str, popped)) + "\n")
                 target_heap = []
                 logger.info("Processed {} TARGET variants".format(count_var_t))
 
     if len(target_heap) > 0:
-        heapq.heapify(target_heap)
-        tmppath = tempfile.NamedTemporaryFile(dir=tmpdir, delete=False)
-        with open(tmppath.name, "wt") as outf:
-            o_tmp_t.append(tmppath.name)
+        target_heap.sort()
+        with tempfile.NamedTemporaryFile("wt", dir=tmpdir, delete=False) as outf:
+            o_tmp_t.append(outf.name)
             outf.write(
                 "CHR:POS:A0:A1\tID_TARGET\tREF_TARGET\tIS_MA_TARGET\tAAF\tF_MISS_DOSAGE\n"
             )
-            for i in range(len(target_heap)):
-                popped = heapq.heappop(target_heap)
-                outf.write("\t".join([str(x) for x in popped[0] + popped[1]]) + "\n")
+            for popped in target_heap:
+                outf.write("\t".join(map(str, popped)) + "\n")
         del target_heap
         logger.info("Processed {} TARGET variants".format(count_var_t))
 
+    # Merge sorted runs and join matched variants in one pass
+    # merged variants are written out as the join consumes them, instead of writing
+    # the sorted files and then reading (and decompressing) them again to join
+    logger.info("Outputting REFERENCE variants -> reference_variants.txt.gz")
     logger.info("Outputting TARGET variants -> target_variants.txt.gz")
-    with xopen(outdir / "target_variants.txt.gz", "wt") as outf:
-        outf.write(
+    logger.info("Joining & outputting matched variants -> matched_variants.txt.gz")
+    n_matched = 0
+    n_PCA_ELIGIBLE = 0
+    with xopen(outdir / "reference_variants.txt.gz", "wt") as ref_outf, xopen(
+        outdir / "target_variants.txt.gz", "wt"
+    ) as target_outf, xopen(outdir / "matched_variants.txt.gz", "w") as csvfile:
+        ref_outf.write(
+            "CHR:POS:A0:A1\tID_REF\tREF_REF\tIS_INDEL\tSTRANDAMB\tIS_MA_REF\n"
+        )
+        ref_variants = merge_sorted_runs(
+            o_tmp_r,
+            outf=ref_outf,
+            key=lambda v: (v["CHR:POS:A0:A1"], v["ID_REF"], v["REF_REF"]),
+        )
+        target_outf.write(
             "CHR:POS:A0:A1\tID_TARGET\tREF_TARGET\tIS_MA_TARGET\tAAF\tF_MISS_DOSAGE\n"
         )
-        for v in heapq.merge(
-            *[read_var_general(x) for x in o_tmp_t],
+        target_variants = merge_sorted_runs(
+            o_tmp_t,
+            outf=target_outf,
             key=lambda v: (v["CHR:POS:A0:A1"], v["ID_TARGET"], v["REF_TARGET"]),
-        ):
-            outf.write("\t".join(v.values()) + "\n")
+        )
 
-    # Merge matched variants on sorted files
-    logger.info("Joining & outputting matched variants -> matched_variants.txt.gz")
-    n_matched = 0
-    n_PCA_ELIGIBLE = 0
-    with xopen(outdir / "matched_variants.txt.gz", "w") as csvfile:
-        for vmatch in sorted_join_variants(
-            outdir / "reference_variants.txt.gz", outdir / "target_variants.txt.gz"
-        ):
+        for vmatch in sorted_join_variants(ref_variants, target_variants):
             n_matched += 1
             vmatch["SAME_REF"] = vmatch["REF_REF"] == vmatch["REF_REF"]
 
@@ -210,6 +212,18 @@ def run_intersect():
                 )
                 writer.writeheader()
             writer.writerow(vmatch)
+
+        # the join stops at the end of the shortest file, but every variant is output
+        for _ in ref_variants:
+            pass
+        for _ in target_variants:
+            pass
+
+    # sorted runs are only read once by the merge, so free up space
+    _remove_tmp(o_tmp_r)
+    _remove_tmp(o_tmp_t)
+    os.rmdir(tmpdir)
+
     logger.info(
         "{}/{} ({:.2f}%) of TARGET variants matched the REFERENCE data".format(
             n_matched, count_var_t, 100 * n_matched / count_var_t
@@ -247,10 +261,10 @@ def read_var_general(path, chrom=None):
                 for row in reader:
                     yield dict(zip(fields, row, strict=True))
             else:
+                # check the chromosome before building a dict for the variant
                 for row in reader:
-                    row = dict(zip(fields, row, strict=True))
-                    if row["#CHROM"] == chrom:
-                        yield row
+                    if row[0] == chrom:
+                        yield dict(zip(fields, row, strict=True))
         else:
             fields = None
             if (chrom is None) or (chrom == "ALL"):
@@ -264,22 +278,34 @@ def read_var_general(path, chrom=None):
                         else:
                             yield dict(zip(fields, row, strict=True))
             else:
+                # #CHROM is always the first pvar column, so variants on other
+                # chromosomes are skipped before they're split and built into a dict
+                chrom_prefix = f"{chrom}\t"
                 for row in f:
                     if row.startswith("##"):
                         continue
-                    else:
-                        row = row.strip().split("\t")
-                        if fields is None:
-                            fields = row
-                        else:
-                            row = dict(zip(fields, row, strict=True))
-                            if row["#CHROM"] == chrom:
-                                yield row
+                    elif fields is None:
+                        fields = row.strip().split("\t")
+                    elif row.startswith(chrom_prefix):
+                        yield dict(zip(fields, row.strip().split("\t"), strict=True))
 
 
-def sorted_join_variants(path_ref, path_target):
-    f1_iter = read_var_general(path_ref)
-    f2_iter = read_var_general(path_target)
+def _remove_tmp(paths):
+    """Delete temporary sorted runs after they've been merged"""
+    for path in paths:
+        os.remove(path)
+
+
+def merge_sorted_runs(paths, outf, key):
+    """Merge sorted runs of variants, writing each variant to outf as it's yielded"""
+    for v in heapq.merge(*[read_var_general(x) for x in paths], key=key):
+        outf.write("\t".join(v.values()) + "\n")
+        yield v
+
+
+def sorted_join_variants(ref_variants, target_variants):
+    f1_iter = iter(ref_variants)
+    f2_iter = iter(target_variants)
 
     prev_key1 = None  # Initialize previous key for file 1
     prev_key2 = None  # Initialize previous key for file 2
@@ -313,22 +339,17 @@ def sorted_join_variants(path_ref, path_target):
             line2 = next(f2_iter, None)
 
 
+# built once at import, not for every allele
+_COMPLEMENT_TABLE = str.maketrans("ATCG", "TAGC")
+
+
 def allele_complement(s):
     """
     Complement alleles
     :param s: allele to be complemented
     :return: complement
     """
-    return (
-        s.replace("A", "V")
-        .replace("T", "X")
-        .replace("C", "Y")
-        .replace("G", "Z")
-        .replace("V", "T")
-        .replace("X", "A")
-        .replace("Y", "G")
-        .replace("Z", "C")
-    )
+    return s.translate(_COMPLEMENT_TABLE)
 
 
 def aaf2maf(aaf):
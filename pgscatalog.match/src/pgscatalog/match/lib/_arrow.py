@@ -30,9 +30,11 @@ def _(path: NormalisedScoringFile, tmpdir=None):
     if tmpdir is None:
         tmpdir = tempfile.mkdtemp()
     # alleles are first read as strings and converted to categoricals later
+    # positions fit in 32 bits (chr1 is ~250 Mb), target positions must use the
+    # same type to join
     dtypes = {
         "chr_name": pl.Categorical,
-        "chr_position": pl.UInt64,
+        "chr_position": pl.UInt32,
         "effect_allele": pl.String,
         "other_allele": pl.String,
         "effect_weight": pl.String,
@@ -59,7 +61,7 @@ def _(path: TargetVariants, tmpdir=None):
                 "column_1": pl.Categorical,
                 "column_2": pl.String,
                 "column_3": pl.UInt8,
-                "column_4": pl.UInt64,
+                "column_4": pl.UInt32,
                 "column_5": pl.String,
                 "column_6": pl.String,
             }
@@ -70,7 +72,7 @@ def _(path: TargetVariants, tmpdir=None):
             # order of dict is important
             dtypes = {
                 "#CHROM": pl.Categorical,
-                "POS": pl.UInt64,
+                "POS": pl.UInt32,
                 "ID": pl.String,
                 "REF": pl.String,
                 "ALT": pl.String,
@@ -101,9 +103,10 @@ def batch_read(reader, tmpdir, cols_keep) -> list[pathlib.Path]:
     batch_size = 100
     batches = reader.next_batches(batch_size)
     while batches:
-        arrowpath = tempfile.NamedTemporaryFile(dir=tmpdir, delete=False)
         df = pl.concat(batches).select(cols_keep)
-        df.write_ipc(arrowpath)
+        # write through the open handle instead of leaking one per batch
+        with tempfile.NamedTemporaryFile(dir=tmpdir, delete=False) as arrowpath:
+            df.write_ipc(arrowpath)
         batches = reader.next_batches(batch_size)
         arrowpaths.append(pathlib.Path(arrowpath.name))
 
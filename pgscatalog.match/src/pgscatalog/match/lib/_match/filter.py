@@ -22,41 +22,28 @@ def filter_scores(
         match_log
     ).collect()  # collect for iteration
 
-    scores: list[pl.DataFrame] = []
-    for accession, rate in zip(
-        fail_rates["accession"].to_list(), fail_rates["fail_rate"].to_list()
-    ):
-        if rate <= (1 - min_overlap):
-            df: pl.DataFrame = pl.DataFrame(
-                {
-                    "accession": [accession],
-                    "score_pass": [True],
-                    "match_rate": [1 - rate],
-                }
-            )
+    # summarise all accessions with expressions, instead of one DataFrame per row
+    score_summary: pl.DataFrame = fail_rates.select(
+        pl.col("accession").cast(pl.Categorical),
+        score_pass=pl.col("fail_rate") <= (1 - min_overlap),
+        match_rate=1 - pl.col("fail_rate"),
+    )
+
+    for accession, score_pass, match_rate in score_summary.iter_rows():
+        if score_pass:
             logger.debug(
-                f"Score {accession} passes minimum matching threshold ({1 - rate:.2%}  variants match)"
+                f"Score {accession} passes minimum matching threshold ({match_rate:.2%}  variants match)"
             )
-            scores.append(df.with_columns(pl.col("accession").cast(pl.Categorical)))
         else:
-            df: pl.DataFrame = pl.DataFrame(
-                {
-                    "accession": [accession],
-                    "score_pass": [False],
-                    "match_rate": [1 - rate],
-                }
-            )
             logger.error(
-                f"Score {accession} fails minimum matching threshold ({1 - rate:.2%} variants match)"
+                f"Score {accession} fails minimum matching threshold ({match_rate:.2%} variants match)"
             )
-            scores.append(df.with_columns(pl.col("accession").cast(pl.Categorical)))
 
-    score_summary: pl.LazyFrame = pl.concat(scores).lazy()
     filtered_scores: pl.LazyFrame = filtered_matches.join(
-        score_summary, on="accession", how="left"
+        score_summary.lazy(), on="accession", how="left"
     ).filter(pl.col("score_pass"))
 
-    return filtered_scores, score_summary.collect()
+    return filtered_scores, score_summary
 
 
 def _calculate_match_rate(df: pl.LazyFrame) -> pl.LazyFrame:
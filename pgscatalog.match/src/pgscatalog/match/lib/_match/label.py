@@ -10,7 +10,6 @@ import logging
 import pathlib
 
 import polars as pl
-from xopen import xopen
 
 from .preprocess import complement_valid_alleles
 
@@ -51,27 +50,24 @@ def label_matches(
 
 def _encode_match_priority(df: pl.LazyFrame) -> pl.LazyFrame:
     """Encode a new column called match status containing matched, unmatched, excluded, and not_best"""
+    # replace() runs inside the polars engine, unlike calling a python lambda per row
     return (
         df.with_columns(
             # set false best match to not_best
-            match_priority=pl.col("best_match").map_elements(
-                lambda x: {None: 0, True: 1, False: 3}[x], return_dtype=pl.UInt8
-            )
-        )
-        .with_columns(
-            excluded_match_priority=pl.col("exclude").map_elements(
-                lambda x: {None: 0, True: 2, False: 0}[x], return_dtype=pl.UInt8
-            )
+            match_priority=pl.col("best_match").replace(
+                {True: 1, False: 3}, return_dtype=pl.UInt8
+            ),
+            excluded_match_priority=pl.col("exclude").replace(
+                {True: 2, False: 0}, return_dtype=pl.UInt8
+            ),
         )
         .with_columns(
             max=pl.max_horizontal("match_priority", "excluded_match_priority")
         )
         .with_columns(
             match_status=pl.col("max")
-            .map_elements(
-                lambda x: {0: "unmatched", 1: "matched", 2: "excluded", 3: "not_best"}[
-                    x
-                ],
+            .replace(
+                {0: "unmatched", 1: "matched", 2: "excluded", 3: "not_best"},
                 return_dtype=pl.String,
             )
             .cast(pl.Categorical)
@@ -93,26 +89,21 @@ def _label_best_match(df: pl.LazyFrame) -> pl.LazyFrame:
         "no_oa_ref_flip": 6,
         "no_oa_alt_flip": 7,
     }
-    match_priority_rev = {v: k for k, v in match_priority.items()}
 
     # use a groupby aggregation to guarantee the number of rows stays the same
     # rows were being lost using an anti join + reduce approach
-    prioritised: pl.LazyFrame = (
-        df.with_columns(match_priority=pl.col("match_type").replace(match_priority))
-        .with_columns(
-            best_match_type=pl.col("match_priority")
-            .min()
-            .over(["accession", "row_nr"])
-            .replace(match_priority_rev)
-        )
-        .with_columns(
-            best_match=pl.when(pl.col("best_match_type") == pl.col("match_type"))
-            .then(pl.lit(True))
-            .otherwise(pl.lit(False))
+    # compare integer priorities directly, instead of mapping the minimum back to a
+    # match type string and comparing strings
+    prioritised: pl.LazyFrame = df.with_columns(
+        match_priority=pl.col("match_type").replace(
+            match_priority, return_dtype=pl.UInt8
         )
+    ).with_columns(
+        best_match=pl.col("match_priority")
+        == pl.col("match_priority").min().over(["accession", "row_nr"])
     )
 
-    return prioritised.drop(["match_priority", "best_match_type"])
+    return prioritised.drop("match_priority")
 
 
 def _label_duplicate_best_match(df: pl.LazyFrame) -> pl.LazyFrame:
@@ -143,16 +134,13 @@ def _label_duplicate_best_match(df: pl.LazyFrame) -> pl.LazyFrame:
             .otherwise(pl.lit(False))
         )
         .drop("count")
-        .with_row_index(
-            name="temp_row_nr"
-        )  # add temporary row count to get first variant
         .with_columns(
+            # only the first row of each accession / row_nr keeps its best match flag
+            # is_first_distinct is a single hashing pass, unlike a row index + window
             best_match=pl.when(
                 pl.col("best_match")
                 & pl.col("duplicate_best_match")
-                & (pl.col("temp_row_nr") > pl.min("temp_row_nr")).over(
-                    ["accession", "row_nr"]
-                )
+                & ~pl.struct("accession", "row_nr").is_first_distinct()
             )
             .then(False)  # reset best match flag for duplicates
             .otherwise(pl.col("best_match"))  # just keep value from existing column
@@ -285,11 +273,9 @@ def _label_multiallelic(df: pl.LazyFrame, remove_multiallelic: bool) -> pl.LazyF
 
 
 def _label_flips(df: pl.LazyFrame, skip_flip: bool) -> pl.LazyFrame:
+    # every flipped match strategy has a _flip suffix, so skip the regex engine
     df = df.with_columns(
-        pl.when(pl.col("match_type").str.contains("_flip"))
-        .then(True)
-        .otherwise(False)
-        .alias("match_flipped")
+        pl.col("match_type").str.ends_with("_flip").alias("match_flipped")
     )
     if skip_flip:
         logger.debug("Labelling flipped matches with exclude flag")
@@ -307,8 +293,20 @@ def _label_flips(df: pl.LazyFrame, skip_flip: bool) -> pl.LazyFrame:
 def _label_filter(df: pl.LazyFrame, filter_IDs: pathlib.Path) -> pl.LazyFrame:
     if filter_IDs is not None:
         logger.debug("Reading filter file (variant IDs)")
-        with xopen(filter_IDs, "r") as f:
-            filt_series = pl.Series([line.strip() for line in f], dtype=pl.Utf8)
+        # filter files can contain millions of IDs, so read them with polars instead
+        # of building a python string for every line
+        filt_series = (
+            pl.read_csv(
+                filter_IDs,
+                has_header=False,
+                schema={"ID": pl.Utf8},
+                separator="\t",
+                quote_char=None,
+                raise_if_empty=False,
+            )
+            .get_column("ID")
+            .str.strip_chars()
+        )
 
         nIDs = len(filt_series)
         logger.debug(
@@ -24,7 +24,6 @@ def make_summary_log(
     """Make an aggregated table that contains the best match candidate for each row in the original scoring file"""
     logger.debug("Aggregating best matches into a summary table")
     cols = [
-        "dataset",
         "accession",
         "ambiguous",
         "is_multiallelic",
@@ -37,14 +36,16 @@ def make_summary_log(
 
     best_matches: pl.LazyFrame = match_candidates.filter(pl.col("best_match"))
 
+    # dataset is the same for every variant, so add it after aggregating
     return (
         scorefile.join(best_matches, on=["row_nr", "accession"], how="full")
         .with_columns(
-            pl.col("match_status").fill_null(value="unmatched"), dataset=pl.lit(dataset)
+            pl.col("match_status").fill_null(value="unmatched")
         )  # fill in unmatched variants
         .group_by(cols)
         .len()
         .rename({"len": "count"})
+        .with_columns(dataset=pl.lit(dataset))
         .join(filter_summary, how="left", on="accession")
         .pipe(_prettify_summary)
     )
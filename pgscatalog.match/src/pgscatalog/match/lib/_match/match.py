@@ -8,6 +8,26 @@ logger = logging.getLogger(__name__)
 def get_all_matches(
     scorefile: pl.LazyFrame, target: pl.LazyFrame
 ) -> list[pl.LazyFrame]:
+    # each match strategy scans the scoring file again, so prepare it (complementing
+    # alleles, casting to categoricals) once and share it instead
+    scorefile = scorefile.collect().lazy()
+
+    logger.debug("Filtering target to scoring file positions")
+    # targets are usually much bigger than scoring files, so drop target positions
+    # that can't match once, instead of scanning the full target for every strategy
+    # the filtered target only keeps rows at positions in the scoring file, so it's
+    # small enough to collect here and share with all match strategies
+    target = (
+        target.join(
+            scorefile.select(["chr_name", "chr_position"]).unique(),
+            left_on=["#CHROM", "POS"],
+            right_on=["chr_name", "chr_position"],
+            how="semi",
+        )
+        .collect()
+        .lazy()
+    )
+
     scorefile_oa = scorefile.filter(pl.col("other_allele").is_not_null())
     scorefile_no_oa = scorefile.filter(pl.col("other_allele").is_null())
 
@@ -123,24 +143,21 @@ def match_variants(
             logger.critical(f"Invalid match strategy: {match_type}")
             raise Exception
 
-    missing_cols = ["REF", "ALT"]
-    if match_type.startswith("no_oa"):
-        if match_type.startswith("no_oa_ref"):
-            missing_cols = ["REF"]
-        else:
-            missing_cols = ["ALT"]
-    join_cols = ["ID"] + missing_cols
-    return (
-        scorefile.join(
-            other=target, left_on=score_keys, right_on=target_keys, how="inner"
-        )
-        .with_columns(
-            [
-                pl.col("*"),
-                pl.col(effect_allele_column).alias("matched_effect_allele"),
-                pl.lit(match_type).alias("match_type"),
-            ]
-        )
-        # note: get REF / ALT back after first join
-        .join(target.select(join_cols), on="ID", how="inner")
+    # the join drops target REF / ALT keys, but they're equal to the scoring file keys
+    # so copy them back instead of joining the target again on ID (which also paired
+    # exploded multiallelic variants with every ALT sharing the same ID)
+    missing_cols = [
+        pl.col(score_key).alias(target_key)
+        for score_key, target_key in zip(score_keys, target_keys)
+        if target_key in ("REF", "ALT")
+    ]
+    return scorefile.join(
+        other=target, left_on=score_keys, right_on=target_keys, how="inner"
+    ).with_columns(
+        [
+            pl.col("*"),
+            pl.col(effect_allele_column).alias("matched_effect_allele"),
+            pl.lit(match_type).alias("match_type"),
+            *missing_cols,
+        ]
     )
@@ -23,7 +23,9 @@ def plinkify(df):
         "matched_effect_allele",
         "effect_weight",
     ]
-    df = df.select(min_cols).lazy()
+    # collect once: the input is usually a lazy label + filter query, which would
+    # otherwise be recomputed for each effect type split below
+    df = df.lazy().select(min_cols).collect().lazy()
 
     # 1. split by effect type
     effect_frames = zip(
@@ -62,29 +64,6 @@ def pivot_score(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _check_column_types(matches: pl.LazyFrame):
-    logger.debug("Checking column types")
-    # these columns are most important for writing out
-    correct_schema = {
-        "chr_name": pl.Categorical,
-        "chr_position": pl.UInt64,
-        "ID": pl.Utf8,
-        "matched_effect_allele": pl.Categorical,
-        "effect_weight": pl.Float64,
-        "effect_type": pl.Categorical,
-        "accession": pl.Categorical,
-    }
-    col_types = {
-        x: matches.schema.get(x)
-        for x in list((matches.schema.keys() & correct_schema.keys()))
-    }
-    if not (col_types == correct_schema):
-        logger.critical(
-            f"MISMATCHED SCHEMA\nCurrent columns: {col_types}\nCorrect schema:{correct_schema}"
-        )
-        raise ValueError
-
-
 def _split_effect_type(
     df: pl.LazyFrame,
 ) -> tuple[pl.LazyFrame, pl.LazyFrame, pl.LazyFrame]:
@@ -4,6 +4,9 @@ import polars as pl
 
 logger = logging.getLogger(__name__)
 
+# chromosomes that can be matched against scoring files
+_VALID_CHROMS: list[str] = [str(x) for x in range(1, 23)] + ["X", "Y"]
+
 
 def filter_target(df: pl.LazyFrame) -> pl.LazyFrame:
     """Remove variants that won't be matched against the scorefile
@@ -11,8 +14,7 @@ def filter_target(df: pl.LazyFrame) -> pl.LazyFrame:
     Chromosomes 1 - 22, X, and Y with an efficient join. Remmove variants with missing identifiers also
     """
     logger.debug("Filtering target to include chromosomes 1 - 22, X, Y")
-    chroms = [str(x) for x in list(range(1, 23)) + ["X", "Y"]]
-    return df.filter((pl.col("#CHROM").is_in(chroms)) & (pl.col("ID") != "."))
+    return df.filter((pl.col("#CHROM").is_in(_VALID_CHROMS)) & (pl.col("ID") != "."))
 
 
 def complement_valid_alleles(df: pl.LazyFrame, flip_cols: list[str]) -> pl.LazyFrame:
@@ -23,15 +25,8 @@ def complement_valid_alleles(df: pl.LazyFrame, flip_cols: list[str]) -> pl.LazyF
         df = df.with_columns(
             pl.when(pl.col(col).str.contains("^[ACGT]+$"))
             .then(
-                pl.col(col)
-                .str.replace_all("A", "V")
-                .str.replace_all("T", "X")
-                .str.replace_all("C", "Y")
-                .str.replace_all("G", "Z")
-                .str.replace_all("V", "T")
-                .str.replace_all("X", "A")
-                .str.replace_all("Y", "G")
-                .str.replace_all("Z", "C")
+                # one pass over each allele instead of eight chained replacements
+                pl.col(col).str.replace_many(["A", "T", "C", "G"], ["T", "A", "G", "C"])
             )
             .otherwise(pl.col(col))
             .alias(new_col)
@@ -43,15 +38,14 @@ def annotate_multiallelic(df: pl.LazyFrame) -> pl.LazyFrame:
     """Identify variants that are multiallelic with a column flag"""
     # plink2 pvar multi-alleles are comma-separated
     df: pl.LazyFrame = df.with_columns(
-        pl.when(pl.col("ALT").str.contains(","))
+        pl.when(pl.col("ALT").str.contains(",", literal=True))
         .then(pl.lit(True))
         .otherwise(pl.lit(False))
         .alias("is_multiallelic")
     )
 
-    if (
-        df.select("is_multiallelic").unique().collect().get_column("is_multiallelic")
-    ).any():
+    # only a single boolean is needed, not the unique values of the column
+    if df.select(pl.col("is_multiallelic").any()).collect().item():
         logger.debug("Exploding dataframe to handle multiallelic variants")
         return df.with_columns(pl.col("ALT").str.split(by=",")).explode("ALT")
     else:
@@ -39,6 +39,8 @@ class PlinkFrame:
     def write(self, directory, dataset, split=False):
         """Write a plink2 --score compatible file, optionally splitting"""
         fouts = []
+        # scoring files are big and repetitive, gzip level 6 is much faster than
+        # the default level 9 for a couple of percent more bytes
         if split:
             dfs = self.split_pivot()
             for chrom, df in dfs.items():
@@ -46,7 +48,7 @@ class PlinkFrame:
                     pathlib.Path(directory)
                     / f"{dataset}_{chrom}_{str(self.effect_type)}_{self.n}.scorefile.gz"
                 )
-                with gzip.open(fout, "wb") as f:
+                with gzip.open(fout, "wb", compresslevel=6) as f:
                     df.write_csv(f, separator="\t")
                 fouts.append(fout)
         else:
@@ -56,7 +58,7 @@ class PlinkFrame:
                 / f"{dataset}_{chrom}_{str(self.effect_type)}_{self.n}.scorefile.gz"
             )
             df = self.pivot_wide()
-            with gzip.open(fout, "wb") as f:
+            with gzip.open(fout, "wb", compresslevel=6) as f:
                 df.write_csv(f, separator="\t")
             fouts.append(fout)
         return fouts
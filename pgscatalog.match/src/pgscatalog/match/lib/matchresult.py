@@ -13,6 +13,16 @@ from ._match.log import make_logs, check_log_count, make_summary_log
 logger = logging.getLogger(__name__)
 
 
+def _scan_candidates(ipc_path):
+    """Lazily read match candidates from an Arrow IPC file
+
+    Older versions wrote positions as UInt64, so cast them to the UInt32 used when
+    reading scoring files, allowing old and new candidate files to be combined"""
+    return pl.scan_ipc(ipc_path, memory_map=False).with_columns(
+        pl.col("chr_position").cast(pl.UInt32)
+    )
+
+
 class MatchResult:
     """Represents variants in a scoring file matched against variants in a target genome
 
@@ -61,7 +71,7 @@ class MatchResult:
         match (self.ipc_path, matchresult):
             case (_, None):
                 # init from results already written to a file
-                self.df = pl.scan_ipc(self.ipc_path)
+                self.df = _scan_candidates(self.ipc_path)
             case (None, _):
                 # init from a lazy frame result from get_all_matches()
                 # needs to be collected() later and optionally written to an IPC file
@@ -75,8 +85,12 @@ class MatchResult:
             raise ValueError("Can't collect, missing matchresult")
 
         if outfile is not None:
-            pl.concat(pl.collect_all(self._matchresult)).write_ipc(outfile)
-            self.df = pl.scan_ipc(outfile)
+            # match candidates compress very well (~8x) and zstd costs little extra
+            # time, compressed IPC files can't be memory mapped
+            pl.concat(pl.collect_all(self._matchresult)).write_ipc(
+                outfile, compression="zstd"
+            )
+            self.df = pl.scan_ipc(outfile, memory_map=False)
         else:
             # call .lazy() to prevent eager queries later
             self.df = pl.concat(pl.collect_all(self._matchresult)).lazy()
@@ -178,8 +192,9 @@ class MatchResults(collections.abc.Sequence):
 
         self.dataset = self._elements[0].dataset
         # a df composed of all match result elements
-        self.df = pl.scan_ipc(x.ipc_path for x in self._elements)
-        if self.df.select("row_nr").collect().is_empty():
+        self.df = pl.concat([_scan_candidates(x.ipc_path) for x in self._elements])
+        # only one row is needed to know candidates exist, so stop reading after it
+        if self.df.select("row_nr").head(1).collect().is_empty():
             raise ZeroMatchesError("No match candidates found for any scoring files")
 
         # a table containing up to one row per variant (the best possible match)
@@ -220,13 +235,19 @@ class MatchResults(collections.abc.Sequence):
         * ``remove_multiallelic`` remove multiallelic variants before matching (default: ``True``)
         * ``filter_IDs``: constrain variants to this list of IDs (default, don't constrain)
         """
-        df = self.df.pipe(
-            label_matches,
-            keep_first_match=keep_first_match,
-            remove_ambiguous=remove_ambiguous,
-            skip_flip=skip_flip,
-            remove_multiallelic=remove_multiallelic,
-            filter_IDs=filter_IDs,
+        # labelling is expensive and the labels are read again by filtering, the logs,
+        # and writing scoring files, so collect the labelled candidates once
+        df = (
+            self.df.pipe(
+                label_matches,
+                keep_first_match=keep_first_match,
+                remove_ambiguous=remove_ambiguous,
+                skip_flip=skip_flip,
+                remove_multiallelic=remove_multiallelic,
+                filter_IDs=filter_IDs,
+            )
+            .collect()
+            .lazy()
         )
         self._labelled = True
         self.df = df
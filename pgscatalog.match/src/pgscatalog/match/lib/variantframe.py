@@ -28,6 +28,12 @@ class VariantFrame:
     >>> x  # doctest: +ELLIPSIS
     VariantFrame(path='.../hapnest.bim', dataset='hapnest', chrom=None, cleanup=True, tmpdir=None)
 
+    Targets can be filtered to a single chromosome:
+
+    >>> with VariantFrame(path, dataset="hapnest", chrom="1") as df:
+    ...     df.collect().shape
+    (14, 6)
+
     The :class:`VariantFrame` contains a :class:`pgscatalog.core.TargetVariants` object:
 
     >>> x.variants  # doctest: +ELLIPSIS
@@ -55,9 +61,15 @@ class VariantFrame:
             self._loosed = True
             logger.debug(f"{self!r} feather conversion complete")
 
+        target_df = pl.scan_ipc(self.arrowpaths)
+
+        if self.chrom is not None:
+            # filter first, so checking for multiallelic variants skips other chromosomes
+            logger.debug(f"Filtering target to chromosome {self.chrom}")
+            target_df = target_df.filter(pl.col("#CHROM") == self.chrom)
+
         target_df = (
-            pl.scan_ipc(self.arrowpaths)
-            .pipe(filter_target)
+            target_df.pipe(filter_target)
             .pipe(annotate_multiallelic)
             .with_columns(
                 [
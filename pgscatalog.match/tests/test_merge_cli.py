@@ -1,5 +1,6 @@
 import itertools
 from unittest.mock import patch
+import polars as pl
 import pytest
 
 from glob import glob
@@ -146,3 +147,40 @@ def test_strict_merge(tmp_path_factory, good_scorefile, match_ipc):
 
     # don't write any scoring files
     assert glob(str(outdir / "*scorefile.gz")) == []
+
+
+def test_merge_mixed_position_types(tmp_path_factory, good_scorefile, match_ipc):
+    """Test merging candidate files with UInt64 positions (written by older
+    versions) and UInt32 positions"""
+    outdir = tmp_path_factory.mktemp("outdir")
+
+    df = pl.read_ipc(match_ipc)
+    half = df.height // 2
+    old_ipc, new_ipc = outdir / "old.ipc", outdir / "new.ipc"
+    df.head(half).write_ipc(old_ipc)
+    df.tail(df.height - half).with_columns(
+        pl.col("chr_position").cast(pl.UInt32)
+    ).write_ipc(new_ipc)
+
+    args = [
+        (
+            "pgscatalog-matchmerge",
+            "-d",
+            "test",
+            "-s",
+            str(good_scorefile),
+            "--matches",
+            str(old_ipc),
+            str(new_ipc),
+            "--outdir",
+            str(outdir),
+            "--min_overlap",
+            str(0.75),
+        )
+    ]
+    flargs = list(itertools.chain(*args))
+
+    with patch("sys.argv", flargs):
+        run_merge()
+
+    assert (outdir / "test_ALL_additive_0.scorefile.gz").exists()